@@ -101,10 +101,8 @@ def python_chrono_split(
     num_of_splits = len(ratio)
     splits = [pd.DataFrame({})] * num_of_splits
     df_grouped = data.sort_values(col_timestamp).groupby(split_by_column)
-    for name, group in df_grouped:
-        group_splits = split_pandas_data_with_ratios(
-            df_grouped.get_group(name), ratio, resample=False
-        )
+    for _, group in df_grouped:
+        group_splits = split_pandas_data_with_ratios(group, ratio, resample=False)
         for x in range(num_of_splits):
             splits[x] = pd.concat([splits[x], group_splits[x]])
 
@@ -165,9 +163,9 @@ def python_stratified_split(
     num_of_splits = len(ratio)
     splits = [pd.DataFrame({})] * num_of_splits
     df_grouped = data.groupby(split_by_column)
-    for name, group in df_grouped:
+    for _, group in df_grouped:
         group_splits = split_pandas_data_with_ratios(
-            df_grouped.get_group(name), ratio, resample=True, seed=seed
+            group, ratio, resample=True, seed=seed
         )
         for x in range(num_of_splits):
             splits[x] = pd.concat([splits[x], group_splits[x]])
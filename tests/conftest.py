@@ -4,10 +4,17 @@
 import calendar
 import datetime
 import os
+import numpy as np
 import pandas as pd
 import pytest
 from sklearn.model_selection import train_test_split
 from tests.notebooks_common import path_notebooks
+from reco_utils.common.constants import (
+    DEFAULT_USER_COL,
+    DEFAULT_ITEM_COL,
+    DEFAULT_RATING_COL,
+    DEFAULT_TIMESTAMP_COL,
+)
 
 try:
     from pyspark.sql import SparkSession
@@ -97,6 +104,63 @@ def train_test_dummy_timestamp(pandas_dummy_timestamp):
     return train_test_split(pandas_dummy_timestamp, test_size=0.2, random_state=0)
 
 
+@pytest.fixture(scope="session")
+def test_specs():
+    return {
+        "number_of_rows": 1000,
+        "user_ids": [1, 2, 3, 4, 5],
+        "seed": 123,
+        "ratio": 0.6,
+        "ratios": [0.2, 0.3, 0.5],
+        "split_numbers": [2, 3, 5],
+        "tolerance": 0.01,
+    }
+
+
+@pytest.fixture(scope="session", params=["int", "category"])
+def python_dataset(request, test_specs):
+    """Get Python labels, with user and item IDs stored either as integers or as
+    categoricals"""
+
+    def random_date_generator(rng, start_date, range_in_days):
+        """Helper function to generate random timestamps.
+
+        Reference: https://stackoverflow.com/questions/41006182/generate-random-dates-within-a
+        -range-in-numpy
+        """
+        days_to_add = rng.integers(
+            0, range_in_days, size=range_in_days, dtype=np.int32
+        ).astype("timedelta64[D]")
+        random_dates = np.datetime64(start_date, "D") + days_to_add
+
+        return random_dates.astype("datetime64[ns]")
+
+    rng = np.random.default_rng(test_specs["seed"])
+
+    rating = np.empty(
+        test_specs["number_of_rows"],
+        dtype=[
+            (DEFAULT_USER_COL, "i4"),
+            (DEFAULT_ITEM_COL, "i4"),
+            (DEFAULT_RATING_COL, "i4"),
+            (DEFAULT_TIMESTAMP_COL, "datetime64[ns]"),
+        ],
+    )
+    rating[DEFAULT_USER_COL] = rng.integers(1, 6, test_specs["number_of_rows"])
+    rating[DEFAULT_ITEM_COL] = rng.integers(1, 16, test_specs["number_of_rows"])
+    rating[DEFAULT_RATING_COL] = rng.integers(1, 6, test_specs["number_of_rows"])
+    rating[DEFAULT_TIMESTAMP_COL] = random_date_generator(
+        rng, "2018-01-01", test_specs["number_of_rows"]
+    )
+
+    rating = pd.DataFrame.from_records(rating)
+    if request.param == "category":
+        rating[DEFAULT_USER_COL] = rating[DEFAULT_USER_COL].astype("category")
+        rating[DEFAULT_ITEM_COL] = rating[DEFAULT_ITEM_COL].astype("category")
+
+    return rating
+
+
 @pytest.fixture(scope="module")
 def demo_usage_data(header, sar_settings):
     # load the data
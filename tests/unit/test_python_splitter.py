@@ -1,9 +1,9 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import math
 import pandas as pd
 import numpy as np
-from itertools import product
 import pytest
 
 from reco_utils.dataset.split_utils import (
@@ -19,62 +19,11 @@ from reco_utils.dataset.python_splitters import (
 from reco_utils.common.constants import (
     DEFAULT_USER_COL,
     DEFAULT_ITEM_COL,
-    DEFAULT_RATING_COL,
     DEFAULT_TIMESTAMP_COL,
 )
 
-
-@pytest.fixture(scope="module")
-def test_specs():
-    return {
-        "number_of_rows": 1000,
-        "user_ids": [1, 2, 3, 4, 5],
-        "seed": 123,
-        "ratio": 0.6,
-        "ratios": [0.2, 0.3, 0.5],
-        "split_numbers": [2, 3, 5],
-        "tolerance": 0.01,
-    }
-
-
-@pytest.fixture(scope="module")
-def python_dataset(test_specs):
-    """Get Python labels"""
-
-    def random_date_generator(start_date, range_in_days):
-        """Helper function to generate random timestamps.
-
-        Reference: https://stackoverflow.com/questions/41006182/generate-random-dates-within-a
-        -range-in-numpy
-        """
-        days_to_add = np.arange(0, range_in_days)
-        random_dates = []
-        for i in range(range_in_days):
-            random_date = np.datetime64(start_date) + np.random.choice(days_to_add)
-            random_dates.append(random_date)
-
-        return random_dates
-
-    np.random.seed(test_specs["seed"])
-
-    rating = pd.DataFrame(
-        {
-            DEFAULT_USER_COL: np.random.random_integers(
-                1, 5, test_specs["number_of_rows"]
-            ),
-            DEFAULT_ITEM_COL: np.random.random_integers(
-                1, 15, test_specs["number_of_rows"]
-            ),
-            DEFAULT_RATING_COL: np.random.random_integers(
-                1, 5, test_specs["number_of_rows"]
-            ),
-            DEFAULT_TIMESTAMP_COL: random_date_generator(
-                "2018-01-01", test_specs["number_of_rows"]
-            ),
-        }
-    )
-
-    return rating
+# keys of test_specs holding the split ratio variants each splitter is tested with
+SPLIT_RATIO_KEYS = ["ratio", "ratios", "split_numbers"]
 
 
 def test_split_pandas_data(pandas_dummy_timestamp):
@@ -101,14 +50,9 @@ def test_min_rating_filter(python_dataset):
 
     def count_filtered_rows(data, filter_by="user"):
         split_by_column = DEFAULT_USER_COL if filter_by == "user" else DEFAULT_ITEM_COL
-        data_grouped = data.groupby(split_by_column)
-
-        row_counts = []
-        for name, group in data_grouped:
-            data_group = data_grouped.get_group(name)
-            row_counts.append(data_group.shape[0])
-
-        return row_counts
+        return (
+            data.groupby(split_by_column, sort=False, observed=True).size().to_numpy()
+        )
 
     df_user = min_rating_filter_pandas(df_rating, min_rating=5, filter_by="user")
     df_item = min_rating_filter_pandas(df_rating, min_rating=5, filter_by="item")
@@ -120,7 +64,8 @@ def test_min_rating_filter(python_dataset):
     assert all(item_rating_counts)
 
 
-def test_random_splitter(test_specs, python_dataset):
+@pytest.mark.parametrize("ratio_key", SPLIT_RATIO_KEYS)
+def test_random_splitter(test_specs, python_dataset, ratio_key):
     """Test random splitter for Spark dataframes.
 
     NOTE: some split results may not match exactly with the ratios, which may be owing to the
@@ -131,147 +76,108 @@ def test_random_splitter(test_specs, python_dataset):
     df_rating = python_dataset
 
     splits = python_random_split(
-        df_rating, ratio=test_specs["ratio"], seed=test_specs["seed"]
-    )
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratio"], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        1 - test_specs["ratio"], test_specs["tolerance"]
+        df_rating, ratio=test_specs[ratio_key], seed=test_specs["seed"]
     )
 
-    splits = python_random_split(
-        df_rating, ratio=test_specs["ratios"], seed=test_specs["seed"]
+    _assert_split_sizes(
+        splits,
+        _expected_ratios(test_specs[ratio_key]),
+        test_specs["number_of_rows"],
+        test_specs["tolerance"],
     )
 
-    assert len(splits) == 3
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][0], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][1], test_specs["tolerance"]
-    )
-    assert len(splits[2]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][2], test_specs["tolerance"]
-    )
 
-    splits = python_random_split(
-        df_rating, ratio=test_specs["split_numbers"], seed=test_specs["seed"]
-    )
-
-    assert len(splits) == 3
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][0], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][1], test_specs["tolerance"]
-    )
-    assert len(splits[2]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][2], test_specs["tolerance"]
-    )
-
-
-def test_chrono_splitter(test_specs, python_dataset):
+@pytest.mark.parametrize("ratio_key", SPLIT_RATIO_KEYS)
+def test_chrono_splitter(test_specs, python_dataset, ratio_key):
     """Test chronological splitter for Spark dataframes.
     """
     df_rating = python_dataset
 
     splits = python_chrono_split(
-        df_rating, ratio=test_specs["ratio"], min_rating=10, filter_by="user"
-    )
-
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratio"], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        1 - test_specs["ratio"], test_specs["tolerance"]
-    )
-
-    # Test all time stamps in test are later than that in train for all users.
-    # This is for single-split case.
-    all_later = []
-    for user in test_specs["user_ids"]:
-        df_train = splits[0][splits[0][DEFAULT_USER_COL] == user]
-        df_test = splits[1][splits[1][DEFAULT_USER_COL] == user]
-
-        p = product(df_train[DEFAULT_TIMESTAMP_COL], df_test[DEFAULT_TIMESTAMP_COL])
-        user_later = [a <= b for (a, b) in p]
-
-        all_later.append(user_later)
-    assert all(all_later)
-
-    # Test if both contains the same user list. This is because chrono split is stratified.
-    users_train = splits[0][DEFAULT_USER_COL].unique()
-    users_test = splits[1][DEFAULT_USER_COL].unique()
-
-    assert set(users_train) == set(users_test)
+        df_rating, ratio=test_specs[ratio_key], min_rating=10, filter_by="user"
+    )
+
+    _assert_split_sizes(
+        splits,
+        _expected_ratios(test_specs[ratio_key]),
+        test_specs["number_of_rows"],
+        test_specs["tolerance"],
+    )
+
+    # Test all time stamps in a split are later than that in the previous split for all
+    # users.
+    all_later = True
+    for x in range(len(splits) - 1):
+        latest = (
+            splits[x]
+            .groupby(DEFAULT_USER_COL, observed=True)[DEFAULT_TIMESTAMP_COL]
+            .max()
+        )
+        earliest = (
+            splits[x + 1]
+            .groupby(DEFAULT_USER_COL, observed=True)[DEFAULT_TIMESTAMP_COL]
+            .min()
+        )
+
+        # Both splits must hold the same users for the aggregated timestamps to be
+        # compared position-wise as int64.
+        assert latest.index.equals(earliest.index)
+        all_later &= bool(
+            np.all(latest.to_numpy().view("i8") <= earliest.to_numpy().view("i8"))
+        )
+    assert all_later
+
+    # Test if all splits contain the same user list. This is because chrono split is
+    # stratified.
+    users_train = np.sort(splits[0][DEFAULT_USER_COL].unique())
+    for split in splits[1:]:
+        users_test = np.sort(split[DEFAULT_USER_COL].unique())
+
+        assert np.array_equal(users_train, users_test)
+
+
+@pytest.mark.parametrize("ratio_key", SPLIT_RATIO_KEYS)
+def test_stratified_splitter(test_specs, python_dataset, ratio_key):
+    """Test stratified splitter.
+    """
+    df_rating = python_dataset
 
-    splits = python_chrono_split(
-        df_rating, ratio=test_specs["ratios"], min_rating=10, filter_by="user"
+    splits = python_stratified_split(
+        df_rating, ratio=test_specs[ratio_key], min_rating=10, filter_by="user"
     )
 
-    assert len(splits) == 3
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][0], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][1], test_specs["tolerance"]
-    )
-    assert len(splits[2]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][2], test_specs["tolerance"]
+    _assert_split_sizes(
+        splits,
+        _expected_ratios(test_specs[ratio_key]),
+        test_specs["number_of_rows"],
+        test_specs["tolerance"],
     )
 
-    # Test if timestamps are correctly split. This is for multi-split case.
-    all_later = []
-    for user in test_specs["user_ids"]:
-        df_train = splits[0][splits[0][DEFAULT_USER_COL] == user]
-        df_valid = splits[1][splits[1][DEFAULT_USER_COL] == user]
-        df_test = splits[2][splits[2][DEFAULT_USER_COL] == user]
+    # Test if all splits contain the same user list. This is because stratified split is
+    # stratified.
+    users_train = np.sort(splits[0][DEFAULT_USER_COL].unique())
+    for split in splits[1:]:
+        users_test = np.sort(split[DEFAULT_USER_COL].unique())
 
-        p1 = product(df_train[DEFAULT_TIMESTAMP_COL], df_valid[DEFAULT_TIMESTAMP_COL])
-        p2 = product(df_valid[DEFAULT_TIMESTAMP_COL], df_test[DEFAULT_TIMESTAMP_COL])
-        user_later_1 = [a <= b for (a, b) in p1]
-        user_later_2 = [a <= b for (a, b) in p2]
+        assert np.array_equal(users_train, users_test)
 
-        all_later.append(user_later_1)
-        all_later.append(user_later_2)
-    assert all(all_later)
 
-
-def test_stratified_splitter(test_specs, python_dataset):
-    """Test stratified splitter.
+def _expected_ratios(ratio):
+    """Helper function to get the normalized ratios of all splits for a split ratio variant.
     """
-    df_rating = python_dataset
+    if isinstance(ratio, float):
+        return [ratio, 1 - ratio]
 
-    splits = python_stratified_split(
-        df_rating, ratio=test_specs["ratio"], min_rating=10, filter_by="user"
-    )
-
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratio"], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        1 - test_specs["ratio"], test_specs["tolerance"]
-    )
-
-    # Test if both contains the same user list. This is because stratified split is stratified.
-    users_train = splits[0][DEFAULT_USER_COL].unique()
-    users_test = splits[1][DEFAULT_USER_COL].unique()
+    return [x / sum(ratio) for x in ratio]
 
-    assert set(users_train) == set(users_test)
 
-    splits = python_stratified_split(
-        df_rating, ratio=test_specs["ratios"], min_rating=10, filter_by="user"
-    )
+def _assert_split_sizes(splits, ratios, number_of_rows, tolerance):
+    """Helper function to test if the sizes of splits match the given ratios.
 
-    assert len(splits) == 3
-    assert len(splits[0]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][0], test_specs["tolerance"]
-    )
-    assert len(splits[1]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][1], test_specs["tolerance"]
-    )
-    assert len(splits[2]) / test_specs["number_of_rows"] == pytest.approx(
-        test_specs["ratios"][2], test_specs["tolerance"]
-    )
+    NOTE: row counts may differ from the expected ones by tolerance * number_of_rows.
+    """
+    assert len(splits) == len(ratios)
 
+    max_diff = math.ceil(tolerance * number_of_rows)
+    for split, ratio in zip(splits, ratios):
+        assert abs(len(split) - round(ratio * number_of_rows)) <= max_diff